@@ -17,6 +17,7 @@ import threading
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from .config import app_config
 
@@ -52,6 +53,82 @@ class FormattingResult:
     level_used: FormattingLevel
 
 
+# Patterns de règles basiques
+_SENTENCE_END_PATTERN = re.compile(r"([.!?])\s*")
+_MULTIPLE_SPACES = re.compile(r"\s+")
+_PUNCTUATION_PATTERN = re.compile(r"[.!?,;:]")
+_CAPITALIZE_AFTER_PUNCT = re.compile(r"([.!?])\s+([a-zàâäéèêëïîôùûüç])")
+
+# Mots interrogatifs (recherchés n'importe où: "tu viens quand" est aussi une question)
+_QUESTION_MARKERS: tuple[str, ...] = (
+    "est-ce que",
+    "qu'est-ce",
+    "pourquoi",
+    "comment",
+    "quand",
+    "où",
+    "qui",
+    "quel",
+    "combien",
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_basic_cached(text: str) -> tuple[str, int]:
+    """Formatage basique par règles, mémoïsé (les transcriptions partielles se répètent)"""
+    corrections = 0
+    result = text
+
+    # Normalise les espaces multiples
+    new_result = _MULTIPLE_SPACES.sub(" ", result)
+    if new_result != result:
+        corrections += 1
+        result = new_result
+
+    # Capitalise la première lettre
+    if result and result[0].islower():
+        result = result[0].upper() + result[1:]
+        corrections += 1
+
+    # Capitalise après ponctuation de fin
+    def capitalize_after_punct(match):
+        nonlocal corrections
+        punct = match.group(1)
+        rest = match.group(0)[len(punct) :].lstrip()
+        if rest and rest[0].islower():
+            corrections += 1
+            return punct + " " + rest[0].upper() + rest[1:]
+        return punct + " " + rest
+
+    result = _SENTENCE_END_PATTERN.sub(capitalize_after_punct, result)
+
+    # Ajoute un point final si absent
+    if result and result[-1] not in ".!?":
+        result += "."
+        corrections += 1
+
+    return result, corrections
+
+
+def _capitalize_after_punct(match: re.Match[str]) -> str:
+    """Remplacement pour _CAPITALIZE_AFTER_PUNCT: ponctuation + espace + lettre majuscule"""
+    return match[1] + " " + match[2].upper()
+
+
+def _convert_quotes(text: str) -> str:
+    """Convertit les paires de guillemets droits en guillemets français (« ... »)"""
+    if '"' not in text:
+        return text
+    parts = text.split('"')
+    # Nombre pair de morceaux: le dernier guillemet n'a pas de paire et reste tel quel
+    tail = '"' + parts.pop() if len(parts) % 2 == 0 else ""
+    out = [parts[0]]
+    for i in range(1, len(parts), 2):
+        out.append("« " + parts[i] + " »" + parts[i + 1])
+    out.append(tail)
+    return "".join(out)
+
+
 class SmartFormatter:
     """
     Service de formatage intelligent du texte.
@@ -68,8 +145,8 @@ class SmartFormatter:
     DEFAULT_MODEL = "oliverguhr/fullstop-punctuation-multilang-large"
 
     # Patterns de règles basiques
-    SENTENCE_END_PATTERN = re.compile(r"([.!?])\s*")
-    MULTIPLE_SPACES = re.compile(r"\s+")
+    SENTENCE_END_PATTERN = _SENTENCE_END_PATTERN
+    MULTIPLE_SPACES = _MULTIPLE_SPACES
 
     # Mots qui commencent une phrase (français)
     SENTENCE_STARTERS_FR = {
@@ -213,51 +290,53 @@ class SmartFormatter:
         Returns:
             FormattingResult avec le texte formaté
         """
-        if not text or not text.strip():
+        # Un seul strip(): vide et espaces seuls sortent avant toute autre opération
+        original = text.strip() if text else text
+        if not original:
             return FormattingResult(
                 original_text=text, formatted_text=text, corrections_made=0, level_used=FormattingLevel.NONE
             )
 
-        original = text.strip()
+        # Sélection du niveau de formatage via la table de dispatch (niveau inconnu: pas de formatage)
+        handler = self._LEVEL_HANDLERS.get(self.level, SmartFormatter._result_none)
+        return handler(self, original)
 
-        # Sélection du niveau de formatage
-        if self.level == FormattingLevel.NONE:
-            return FormattingResult(
-                original_text=original, formatted_text=original, corrections_made=0, level_used=FormattingLevel.NONE
-            )
-
-        elif self.level == FormattingLevel.BASIC:
-            formatted, corrections = self._format_basic(original)
-            return FormattingResult(
-                original_text=original,
-                formatted_text=formatted,
-                corrections_made=corrections,
-                level_used=FormattingLevel.BASIC,
-            )
+    def _result_none(self, text: str) -> FormattingResult:
+        """Niveau NONE: texte inchangé"""
+        return FormattingResult(
+            original_text=text, formatted_text=text, corrections_made=0, level_used=FormattingLevel.NONE
+        )
 
-        elif self.level in (FormattingLevel.SMART, FormattingLevel.FULL):
-            # Essaie le formatage IA, sinon fallback sur basique
-            if self._is_loaded and self._pipe:
-                formatted, corrections = self._format_smart(original)
-                return FormattingResult(
-                    original_text=original,
-                    formatted_text=formatted,
-                    corrections_made=corrections,
-                    level_used=FormattingLevel.SMART,
-                )
-            else:
-                formatted, corrections = self._format_basic(original)
-                return FormattingResult(
-                    original_text=original,
-                    formatted_text=formatted,
-                    corrections_made=corrections,
-                    level_used=FormattingLevel.BASIC,
-                )
+    def _result_basic(self, text: str) -> FormattingResult:
+        """Niveau BASIC: formatage par règles"""
+        formatted, corrections = self._format_basic(text)
+        return FormattingResult(
+            original_text=text,
+            formatted_text=formatted,
+            corrections_made=corrections,
+            level_used=FormattingLevel.BASIC,
+        )
 
+    def _result_smart(self, text: str) -> FormattingResult:
+        """Niveaux SMART/FULL: formatage IA, sinon fallback sur basique"""
+        if not (self._is_loaded and self._pipe):
+            return self._result_basic(text)
+        formatted, corrections = self._format_smart(text)
         return FormattingResult(
-            original_text=original, formatted_text=original, corrections_made=0, level_used=FormattingLevel.NONE
+            original_text=text,
+            formatted_text=formatted,
+            corrections_made=corrections,
+            level_used=FormattingLevel.SMART,
         )
 
+    # Table de dispatch par niveau (fonctions non liées: pas de cycle instance -> méthode liée)
+    _LEVEL_HANDLERS: dict[FormattingLevel, Callable[[SmartFormatter, str], FormattingResult]] = {
+        FormattingLevel.NONE: _result_none,
+        FormattingLevel.BASIC: _result_basic,
+        FormattingLevel.SMART: _result_smart,
+        FormattingLevel.FULL: _result_smart,
+    }
+
     def _format_basic(self, text: str) -> tuple[str, int]:
         """
         Formatage basique par règles.
@@ -265,38 +344,7 @@ class SmartFormatter:
         Returns:
             (texte formaté, nombre de corrections)
         """
-        corrections = 0
-        result = text
-
-        # Normalise les espaces multiples
-        new_result = self.MULTIPLE_SPACES.sub(" ", result)
-        if new_result != result:
-            corrections += 1
-            result = new_result
-
-        # Capitalise la première lettre
-        if result and result[0].islower():
-            result = result[0].upper() + result[1:]
-            corrections += 1
-
-        # Capitalise après ponctuation de fin
-        def capitalize_after_punct(match):
-            nonlocal corrections
-            punct = match.group(1)
-            rest = match.group(0)[len(punct) :].lstrip()
-            if rest and rest[0].islower():
-                corrections += 1
-                return punct + " " + rest[0].upper() + rest[1:]
-            return punct + " " + rest
-
-        result = self.SENTENCE_END_PATTERN.sub(capitalize_after_punct, result)
-
-        # Ajoute un point final si absent
-        if result and result[-1] not in ".!?":
-            result += "."
-            corrections += 1
-
-        return result, corrections
+        return _format_basic_cached(text)
 
     def _format_smart(self, text: str) -> tuple[str, int]:
         """
@@ -307,7 +355,7 @@ class SmartFormatter:
         try:
             # Le modèle de ponctuation attend du texte en minuscules sans ponctuation
             clean_text = text.lower()
-            clean_text = re.sub(r"[.!?,;:]", "", clean_text)
+            clean_text = _PUNCTUATION_PATTERN.sub("", clean_text)
             clean_text = self.MULTIPLE_SPACES.sub(" ", clean_text).strip()
 
             if not clean_text:
@@ -406,8 +454,6 @@ class RuleBasedFormatter:
         (re.compile(r"([.,;:!?])(?=[^\s\d\)\]])"), r"\1 "),
         # Espaces multiples
         (re.compile(r"\s{2,}"), " "),
-        # Guillemets français
-        (re.compile(r'"([^"]*)"'), r"« \1 »"),
     ]
 
     # Mots à capitaliser
@@ -454,20 +500,21 @@ class RuleBasedFormatter:
         for pattern, replacement in cls.PATTERNS:
             result = pattern.sub(replacement, result)
 
+        # Guillemets français
+        result = _convert_quotes(result)
+
         # Capitalise la première lettre
         if result and result[0].islower():
             result = result[0].upper() + result[1:]
 
         # Capitalise après .!?
-        result = re.sub(r"([.!?])\s+([a-zàâäéèêëïîôùûüç])", lambda m: m.group(1) + " " + m.group(2).upper(), result)
+        result = _CAPITALIZE_AFTER_PUNCT.sub(_capitalize_after_punct, result)
 
         # Ponctuation finale
         if result and result[-1] not in ".!?":
             # Détecte les questions
-            if any(
-                q in result.lower()
-                for q in ["est-ce que", "qu'est-ce", "pourquoi", "comment", "quand", "où", "qui", "quel", "combien"]
-            ):
+            lowered = result.lower()
+            if any(marker in lowered for marker in _QUESTION_MARKERS):
                 result += " ?"
             else:
                 result += "."
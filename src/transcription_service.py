@@ -18,6 +18,7 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -46,6 +47,14 @@ try:
 except ImportError:
     _HAS_TORCH = False
 
+# Import Hyperscan pour le filtrage des hallucinations (optionnel, fallback sur re)
+try:
+    import hyperscan
+
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
 
 @dataclass(slots=True, frozen=True)
 class TranscriptSegment:
@@ -69,16 +78,175 @@ class TranscriptionResult:
     segments: tuple[TranscriptSegment, ...] | None = None  # Rempli si with_segments=True
 
 
+# Hallucinations courantes de Whisper (source commune à re et Hyperscan)
+# Préfixes communs factorisés: re n'essaie chaque préfixe qu'une fois par position
+_HALLUCINATION_ALTERNATIVES: tuple[str, ...] = (
+    r"Merci (?:d'avoir regardé|à tous)",
+    r"Sous-titres (?:réalisés|par)",
+    r"À bientôt",
+    r"Abonnez-vous",
+    r"N'oubliez pas de",
+    r"Cliquez sur",
+    r"\[(?:Musique|Applaudissements)\]",
+    r"\(Musique\)",
+    r"\.{3,}",
+)
+
 # Patterns d'hallucination pré-compilés pour performance
-_HALLUCINATION_PATTERN = re.compile(
-    r"(Merci d'avoir regardé|Sous-titres réalisés|Sous-titres par|"
-    r"Merci à tous|À bientôt|Abonnez-vous|N'oubliez pas de|"
-    r"Cliquez sur|\[Musique\]|\[Applaudissements\]|\(Musique\)|\.{3,})",
-    re.IGNORECASE,
+# Groupe non capturant: sub() n'a pas besoin de la correspondance
+_HALLUCINATION_PATTERN = re.compile("(?:" + "|".join(_HALLUCINATION_ALTERNATIVES) + ")", re.IGNORECASE)
+# Même pattern, sensible à la casse, appliqué au texte casefold (évite le repliement par caractère d'IGNORECASE)
+_FOLDED_HALLUCINATION_PATTERN = re.compile(
+    "(?:" + "|".join(alternative.casefold() for alternative in _HALLUCINATION_ALTERNATIVES) + ")"
 )
+# Équivalent regex de " ".join(text.split()) (chemin utilisé en production)
 _WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
+# Sous-chaînes (casefold) présentes dans toute hallucination: pré-filtre avant le moteur
+# (à tenir à jour avec _HALLUCINATION_ALTERNATIVES)
+_HALLUCINATION_MARKERS: tuple[str, ...] = (
+    "merci d'avoir regardé",
+    "sous-titres",
+    "merci à tous",
+    "à bientôt",
+    "abonnez-vous",
+    "n'oubliez pas de",
+    "cliquez sur",
+    "musique",
+    "applaudissements",
+    "...",
+)
+
+
+def _has_ignorecase_only_i(text: str) -> bool:
+    """True si le texte contient "ı" ou "İ": re.IGNORECASE les assimile à "i", pas casefold()"""
+    return "ı" in text or "İ" in text
+
+
+def _may_contain_hallucination(text: str) -> bool:
+    """Pré-filtre: False garantit qu'aucune alternative ne peut correspondre"""
+    # Les marqueurs casefold ne voient pas "ı"/"İ": ces textes passent toujours par le moteur
+    if _has_ignorecase_only_i(text):
+        return True
+    folded = text.casefold()
+    return any(marker in folded for marker in _HALLUCINATION_MARKERS)
+
+
+def _compile_hyperscan_database():
+    """Compile les alternatives en une base Hyperscan (DFA multi-pattern), None si indisponible"""
+    if not _HAS_HYPERSCAN:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[alternative.encode("utf-8") for alternative in _HALLUCINATION_ALTERNATIVES],
+            ids=list(range(len(_HALLUCINATION_ALTERNATIVES))),
+            elements=len(_HALLUCINATION_ALTERNATIVES),
+            flags=[flags] * len(_HALLUCINATION_ALTERNATIVES),
+        )
+    except hyperscan.error as e:
+        logger.warning("Hyperscan indisponible, filtrage des hallucinations via re: %s", e)
+        return None
+    return database
+
+
+_HYPERSCAN_DATABASE = _compile_hyperscan_database()
+# Le scratch Hyperscan ne peut pas être partagé entre threads
+_hyperscan_local = threading.local()
+
+
+def _on_hyperscan_match(_id: int, start: int, end: int, _flags: int, spans: list[tuple[int, int]]) -> None:
+    """Callback Hyperscan: collecte les intervalles (en octets) des correspondances"""
+    spans.append((start, end))
+
+
+def _remove_hallucinations_re(text: str) -> str:
+    """Fallback re: correspondances cherchées dans le texte casefold, retirées du texte original"""
+    # "ı"/"İ": même règle que le pré-filtre et Hyperscan, seul IGNORECASE les assimile à "i"
+    if _has_ignorecase_only_i(text):
+        return _HALLUCINATION_PATTERN.sub("", text)
+    folded = text.casefold()
+    # Positions alignées seulement si casefold() conserve la longueur ("ß" -> "ss")
+    if len(folded) != len(text):
+        return _HALLUCINATION_PATTERN.sub("", text)
+
+    pieces: list[str] = []
+    position = 0
+    for match in _FOLDED_HALLUCINATION_PATTERN.finditer(folded):
+        start, end = match.span()
+        pieces.append(text[position:start])
+        position = end
+    if not pieces:
+        return text
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def _remove_hallucinations(text: str) -> str:
+    """Supprime les hallucinations (Hyperscan si disponible, sinon regex pré-compilée)"""
+    # Hyperscan (CASELESS+UCP) n'assimile pas "ı"/"İ" à "i", contrairement à re.IGNORECASE
+    if _HYPERSCAN_DATABASE is None or _has_ignorecase_only_i(text):
+        return _remove_hallucinations_re(text)
+
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:  # surrogates isolés: UTF-8 invalide pour Hyperscan
+        return _remove_hallucinations_re(text)
+
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_HYPERSCAN_DATABASE)
+
+    spans: list[tuple[int, int]] = []
+    _HYPERSCAN_DATABASE.scan(data, match_event_handler=_on_hyperscan_match, context=spans, scratch=scratch)
+    if not spans:
+        return text
+
+    # Hyperscan rapporte toutes les correspondances (chevauchantes): retire leur union en une passe
+    spans.sort()
+    pieces: list[bytes] = []
+    position = 0
+    for start, end in spans:
+        if end <= position:
+            continue
+        pieces.append(data[position : max(start, position)])
+        position = end
+    pieces.append(data[position:])
+    return b"".join(pieces).decode("utf-8")
+
+
+# Séparateur de TranscriptionService.clean_batch: ni blanc ni ponctuation, aucune alternative ne le traverse
+_BATCH_SEPARATOR = "\x00"
+
+
+def _clean_hallucinations_uncached(text: str) -> str:
+    """Supprime les hallucinations courantes de Whisper et normalise les espaces"""
+    # Supprime les hallucinations (scan Hyperscan ou regex pré-compilée),
+    # sauf si le pré-filtre par sous-chaînes exclut toute correspondance (cas courant)
+    if _may_contain_hallucination(text):
+        text = _remove_hallucinations(text)
+
+    # Normalise les espaces et strip en une passe C (split() sans argument et \s
+    # reconnaissent exactement les mêmes blancs, ASCII comme Unicode)
+    return " ".join(text.split())
+
+
+# Mémoïsation réservée aux textes courts: Whisper répète souvent les mêmes sorties brèves
+# (silences, hallucinations); les transcriptions longues (URL/vidéo) ne reviennent pas
+# et resteraient en mémoire dans le cache
+_CLEAN_CACHE_MAX_LENGTH = 512
+_clean_hallucinations_cached = lru_cache(maxsize=256)(_clean_hallucinations_uncached)
+
+
+def _clean_hallucinations(text: str) -> str:
+    """Nettoie une transcription (via le cache si elle est courte)"""
+    if len(text) <= _CLEAN_CACHE_MAX_LENGTH:
+        return _clean_hallucinations_cached(text)
+    return _clean_hallucinations_uncached(text)
+
+
 class TranscriptionService:
     """
     Service de transcription Faster-Whisper optimisé GPU
@@ -329,18 +497,23 @@ class TranscriptionService:
                 if _HAS_TORCH and torch.cuda.is_available():
                     torch.cuda.empty_cache()
 
-    def _clean_hallucinations(self, text: str) -> str:
-        """
-        Supprime les hallucinations courantes de Whisper.
-        Utilise des regex pré-compilées pour performance.
-        """
-        # Supprime les hallucinations avec regex pré-compilée
-        text = _HALLUCINATION_PATTERN.sub("", text)
-
-        # Nettoie les espaces multiples avec regex pré-compilée
-        text = _WHITESPACE_PATTERN.sub(" ", text)
+    # Fonction pure du module, exposée comme méthode pour les appelants existants
+    _clean_hallucinations = staticmethod(_clean_hallucinations)
 
-        return text.strip()
+    @staticmethod
+    def clean_batch(texts: list[str]) -> list[str]:
+        """Nettoie plusieurs transcriptions avec un seul passage du moteur d'hallucinations"""
+        texts = list(texts)
+        # Seuls les textes retenus par le pré-filtre passent par le moteur, en un seul scan
+        # (séparateur absent de la sortie Whisper, sinon nettoyage texte par texte)
+        suspects = [i for i, text in enumerate(texts) if _may_contain_hallucination(text)]
+        if suspects:
+            if any(_BATCH_SEPARATOR in texts[i] for i in suspects):
+                return [_clean_hallucinations(text) for text in texts]
+            joined = _remove_hallucinations(_BATCH_SEPARATOR.join([texts[i] for i in suspects]))
+            for i, cleaned in zip(suspects, joined.split(_BATCH_SEPARATOR), strict=True):
+                texts[i] = cleaned
+        return [" ".join(text.split()) for text in texts]
 
     @property
     def is_loaded(self) -> bool:
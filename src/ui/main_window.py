@@ -50,6 +50,7 @@ from ..utils.clipboard import copy_to_clipboard, type_text
 from ..utils.history import history as transcription_history
 from ..utils.hotkey_listener import GlobalHotkeyListener
 from ..utils.settings import (
+    flush_settings,
     get_history_enabled,
     get_ptt_key,
     get_recording_mode,
@@ -764,6 +765,7 @@ class MainWindow(QMainWindow):
         pos = self.pos()
         set_window_position(pos.x(), pos.y())
         set_window_size(self.width(), self.height())
+        flush_settings()
 
         # Stop hotkeys
         self.hotkey_listener.stop()
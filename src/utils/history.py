@@ -10,8 +10,9 @@ import logging
 import threading
 from collections import deque
 from collections.abc import Iterator
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 
 from ..config import app_config
 
@@ -28,6 +29,9 @@ class TranscriptionEntry:
     language: str
     processing_time: float
 
+    # Cache de formatted_time (l'entrée n'est pas modifiée après création)
+    _formatted_time: str | None = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def create(cls, text: str, duration: float, language: str, processing_time: float) -> TranscriptionEntry:
         """Crée une nouvelle entrée avec timestamp automatique"""
@@ -41,16 +45,24 @@ class TranscriptionEntry:
 
     @property
     def formatted_time(self) -> str:
-        """Retourne l'heure formatée"""
-        try:
-            dt = datetime.fromisoformat(self.timestamp)
-            return dt.strftime("%H:%M:%S")
-        except ValueError:
-            return self.timestamp[:8]
+        """Retourne l'heure formatée (parsée une seule fois)"""
+        if self._formatted_time is None:
+            try:
+                dt = datetime.fromisoformat(self.timestamp)
+                self._formatted_time = dt.strftime("%H:%M:%S")
+            except ValueError:
+                self._formatted_time = self.timestamp[:8]
+        return self._formatted_time
 
     def to_dict(self) -> dict:
         """Convertit en dictionnaire"""
-        return asdict(self)
+        return {
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "duration": self.duration,
+            "language": self.language,
+            "processing_time": self.processing_time,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> TranscriptionEntry:
@@ -74,7 +86,15 @@ class TranscriptionHistory:
     - Thread-safe
     """
 
-    __slots__ = ("_history", "_max_size", "_lock", "_file_path", "_auto_save")
+    __slots__ = (
+        "_history",
+        "_max_size",
+        "_lock",
+        "_file_path",
+        "_auto_save",
+        "_total_duration",
+        "_total_processing_time",
+    )
 
     DEFAULT_MAX_SIZE = 50
     HISTORY_FILENAME = "transcription_history.json"
@@ -83,6 +103,9 @@ class TranscriptionHistory:
         self._history: deque[TranscriptionEntry] = deque(maxlen=max_size)
         self._max_size = max_size
         self._lock = threading.Lock()
+        # Totaux maintenus à chaque ajout/éviction (lecture O(1))
+        self._total_duration = 0.0
+        self._total_processing_time = 0.0
         self._auto_save = persist
 
         if persist:
@@ -100,14 +123,14 @@ class TranscriptionHistory:
             text=text.strip(), duration=duration, language=language, processing_time=processing_time
         )
         with self._lock:
-            self._history.append(entry)
+            self._append_unsafe(entry)
             if self._auto_save:
                 self._save_unsafe()
 
     def add_entry(self, entry: TranscriptionEntry) -> None:
         """Ajoute une entrée pré-créée à l'historique"""
         with self._lock:
-            self._history.append(entry)
+            self._append_unsafe(entry)
             if self._auto_save:
                 self._save_unsafe()
 
@@ -124,8 +147,8 @@ class TranscriptionHistory:
     def get_recent(self, count: int = 10) -> list[TranscriptionEntry]:
         """Retourne les N entrées les plus récentes"""
         with self._lock:
-            items = list(self._history)
-            return items[-count:] if len(items) > count else items
+            # Ne copie que la fin du deque
+            return list(islice(self._history, max(0, len(self._history) - count), None))
 
     def get_all(self) -> list[TranscriptionEntry]:
         """Retourne tout l'historique"""
@@ -136,6 +159,8 @@ class TranscriptionHistory:
         """Vide l'historique"""
         with self._lock:
             self._history.clear()
+            self._total_duration = 0.0
+            self._total_processing_time = 0.0
             if self._auto_save and self._file_path:
                 try:
                     self._file_path.unlink(missing_ok=True)
@@ -159,14 +184,26 @@ class TranscriptionHistory:
     @property
     def total_duration(self) -> float:
         """Durée totale de l'audio transcrit"""
-        with self._lock:
-            return sum(e.duration for e in self._history)
+        return self._total_duration
 
     @property
     def total_processing_time(self) -> float:
         """Temps de traitement total"""
-        with self._lock:
-            return sum(e.processing_time for e in self._history)
+        return self._total_processing_time
+
+    def _append_unsafe(self, entry: TranscriptionEntry) -> None:
+        """Ajoute une entrée et met à jour les totaux (appelé depuis contexte verrouillé)"""
+        if self._history.maxlen == 0:
+            # Rien n'est conservé: les totaux restent nuls
+            return
+        if len(self._history) == self._history.maxlen:
+            # Le deque va évincer la plus ancienne entrée
+            evicted = self._history[0]
+            self._total_duration -= evicted.duration
+            self._total_processing_time -= evicted.processing_time
+        self._history.append(entry)
+        self._total_duration += entry.duration
+        self._total_processing_time += entry.processing_time
 
     def _save_unsafe(self) -> None:
         """Sauvegarde sans lock (appelé depuis contexte verrouillé)"""
@@ -193,7 +230,7 @@ class TranscriptionHistory:
                 for item in data[-self._max_size :]:
                     if isinstance(item, dict):
                         entry = TranscriptionEntry.from_dict(item)
-                        self._history.append(entry)
+                        self._append_unsafe(entry)
 
                 logger.info("Historique charge: %d entrees", len(self._history))
         except Exception as e:
@@ -201,10 +238,8 @@ class TranscriptionHistory:
 
     def export_text(self) -> str:
         """Exporte l'historique en texte"""
-        lines = []
-        for entry in self:
-            lines.append(f"[{entry.formatted_time}] {entry.text}")
-        return "\n".join(lines)
+        with self._lock:
+            return "\n".join(f"[{entry.formatted_time}] {entry.text}" for entry in self._history)
 
 
 # Instance globale (sans persistance par défaut)
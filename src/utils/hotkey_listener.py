@@ -10,6 +10,7 @@ import threading
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pynput import keyboard
 
@@ -29,31 +30,46 @@ class HotkeyBinding:
     description: str = ""
 
 
+# Alias de modificateurs -> nom canonique (ctrl, alt, shift, cmd)
+_MODIFIER_ALIASES: dict[str, str] = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "ctrl_l": "ctrl",
+    "ctrl_r": "ctrl",
+    "alt": "alt",
+    "alt_l": "alt",
+    "alt_r": "alt",
+    "shift": "shift",
+    "shift_l": "shift",
+    "shift_r": "shift",
+    "cmd": "cmd",
+    "win": "cmd",
+    "super": "cmd",
+    "meta": "cmd",
+}
+
+# Combinaisons de modificateurs internées (au plus 16 sous-ensembles de ctrl/alt/shift/cmd)
+_COMBO_CACHE: dict[frozenset[str], frozenset[str]] = {}
+
+
+@lru_cache(maxsize=256)
 def parse_hotkey(hotkey_str: str) -> tuple[str, frozenset[str]]:
     """
     Parse une chaîne de raccourci en touche + modificateurs.
 
+    Résultat mis en cache (les réglages re-parsent souvent la même touche).
+
     Exemples:
         "ctrl+'" -> ("'", frozenset({"ctrl"}))
         "ctrl+shift+f2" -> ("f2", frozenset({"ctrl", "shift"}))
         "f2" -> ("f2", frozenset())
     """
     parts = hotkey_str.lower().split("+")
-    modifiers = set()
     key = parts[-1]  # La dernière partie est la touche principale
 
-    for part in parts[:-1]:
-        part = part.strip()
-        if part in ("ctrl", "control", "ctrl_l", "ctrl_r"):
-            modifiers.add("ctrl")
-        elif part in ("alt", "alt_l", "alt_r"):
-            modifiers.add("alt")
-        elif part in ("shift", "shift_l", "shift_r"):
-            modifiers.add("shift")
-        elif part in ("cmd", "win", "super", "meta"):
-            modifiers.add("cmd")
-
-    return key.strip(), frozenset(modifiers)
+    # Les modificateurs inconnus sont ignorés
+    modifiers = frozenset(_MODIFIER_ALIASES[part] for part in map(str.strip, parts[:-1]) if part in _MODIFIER_ALIASES)
+    return key.strip(), _COMBO_CACHE.setdefault(modifiers, modifiers)
 
 
 class GlobalHotkeyListener:
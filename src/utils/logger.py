@@ -7,11 +7,36 @@ import logging
 import sys
 
 
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter qui ne reformate l'heure qu'une fois par seconde (datefmt sans millisecondes)"""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt, style="%")
+        # (seconde, texte) dans un seul attribut pour une mise à jour atomique entre threads
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second == cached_second:
+            return cached_text
+        text = super().formatTime(record, datefmt)
+        self._time_cache = (second, text)
+        return text
+
+
 def setup_logging(level: int = logging.INFO) -> None:
     """Configure le logging pour l'application WhisperFlow"""
+    # Le format n'utilise ni thread, ni process, ni fichier/ligne source:
+    # évite leur collecte (introspection de la pile) pour chaque record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     fmt = "%(asctime)s %(levelname)-5s [%(name)s] %(message)s"
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter(fmt, datefmt="%H:%M:%S"))
+    handler.setFormatter(_SecondCachedFormatter(fmt, datefmt="%H:%M:%S"))
     root = logging.getLogger()
     root.setLevel(level)
     root.addHandler(handler)
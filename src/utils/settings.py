@@ -7,16 +7,145 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
+import os
+import sys
 import threading
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, replace
+from enum import StrEnum
+from json.encoder import encode_basestring
 from pathlib import Path
 from typing import Any
 
-from ..config import OutputMode, RecordingMode, WindowMode, app_config, hotkey_config
+from ..config import OutputMode, RecordingMode, WindowMode, app_config
 
 logger = logging.getLogger(__name__)
 
+# Import conditionnel d'orjson (plus rapide), fallback sur json stdlib
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# O_BINARY évite la traduction des fins de ligne sous Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _encode_scalar(value: Any) -> str:
+    """Encode une valeur scalaire en JSON (équivalent à json.dumps(..., ensure_ascii=False))"""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return repr(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _load_json(path: Path, file_size: int) -> Any:
+    """Décode le fichier JSON; avec orjson, lit via mmap sans copie intermédiaire"""
+    if not _HAS_ORJSON:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    if file_size == 0:
+        return orjson.loads(b"")  # mmap refuse un fichier vide: lève JSONDecodeError
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        return orjson.loads(view)
+
+
+def _write_bytes(path: Path, payload: bytes, *, fsync: bool) -> None:
+    """Écrit le buffer complet en un write (au lieu d'un par ligne), fsync optionnel"""
+    fd = os.open(path, _WRITE_FLAGS, 0o600)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Rend le renommage durable en synchronisant le dossier parent (POSIX uniquement)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _choice(allowed: frozenset[str], default: str) -> Callable[[Any], str]:
+    """Coercer vers une valeur whitelistée (sinon défaut), renvoyant la chaîne internée"""
+    canonical = {value: sys.intern(value) for value in allowed}
+
+    def coerce(value: Any) -> str:
+        return canonical.get(str(value), default)
+
+    return coerce
+
+
+def _interned(max_len: int) -> Callable[[Any], str]:
+    """Coercer vers une chaîne tronquée et internée (vocabulaire réduit: touches, langues)"""
+
+    def coerce(value: Any) -> str:
+        return sys.intern(str(value)[:max_len])
+
+    return coerce
+
+
+def _enum_member(enum_cls: type[StrEnum], default: StrEnum) -> Callable[[Any], StrEnum]:
+    """Coercer vers un membre d'enum par valeur, sans passer par l'exception ValueError"""
+    members = enum_cls._value2member_map_
+
+    def coerce(value: Any) -> StrEnum:
+        return members.get(str(value), default)
+
+    return coerce
+
+
+def _clamped_int(low: int, high: int, default: int) -> Callable[[Any], int]:
+    """Coercer vers un entier borné (défaut si non convertible)"""
+
+    def coerce(value: Any) -> int:
+        try:
+            return max(low, min(high, int(value)))
+        except (TypeError, ValueError):
+            return default
+
+    return coerce
+
+
+# Table de validation de UserSettings.from_dict (construite une fois à l'import)
+_FIELD_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "push_to_talk_key": _interned(50),
+    "output_mode": _enum_member(OutputMode, OutputMode.TYPE),
+    "language": _interned(10),
+    "ui_language": _choice(frozenset({"auto", "en", "fr"}), "auto"),
+    "smart_formatting_enabled": bool,
+    "smart_formatting_level": _choice(frozenset({"none", "basic", "smart"}), "basic"),
+    "window_mode": _enum_member(WindowMode, WindowMode.FLOATING),
+    "window_position_x": int,
+    "window_position_y": int,
+    "recording_mode": _enum_member(RecordingMode, RecordingMode.PUSH_TO_TALK),
+    "source_mode": _choice(frozenset({"mic", "url"}), "mic"),
+    "window_width": _clamped_int(420, 2000, 480),
+    "window_height": _clamped_int(720, 2000, 780),
+    "url_language": _choice(frozenset({"auto", "fr", "en"}), "auto"),
+    "url_notes_format": _choice(frozenset({"txt", "json"}), "json"),
+}
+
 
 @dataclass(slots=True)
 class UserSettings:
@@ -53,89 +182,27 @@ class UserSettings:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> UserSettings:
         """Crée une instance depuis un dictionnaire (ignores clés inconnues)"""
-        # Valide les valeurs pour éviter injection
-        ptt_key = str(data.get("push_to_talk_key", "f2"))[:50]
-        output_mode = data.get("output_mode", OutputMode.TYPE)
-        language = str(data.get("language", "fr"))[:10]
-        ui_language = str(data.get("ui_language", "auto"))[:10]
-        if ui_language not in ("auto", "en", "fr"):
-            ui_language = "auto"
-
-        # Valide output_mode
-        try:
-            output_mode = OutputMode(output_mode)
-        except ValueError:
-            output_mode = OutputMode.TYPE
-
-        # Smart Formatting
-        smart_enabled = bool(data.get("smart_formatting_enabled", True))
-        smart_level = str(data.get("smart_formatting_level", "basic"))[:10]
-        if smart_level not in ("none", "basic", "smart"):
-            smart_level = "basic"
-
-        # Mode fenêtre
-        window_mode = str(data.get("window_mode", WindowMode.FLOATING))[:20]
-        try:
-            window_mode = WindowMode(window_mode)
-        except ValueError:
-            window_mode = WindowMode.FLOATING
+        # Valide les valeurs pour éviter injection (clés absentes -> défauts du dataclass)
+        return cls(**{key: coerce(data[key]) for key, coerce in _FIELD_COERCERS.items() if key in data})
 
-        window_x = int(data.get("window_position_x", -1))
-        window_y = int(data.get("window_position_y", -1))
+    def to_dict(self) -> dict[str, Any]:
+        """Convertit en dictionnaire (champs scalaires: pas de copie récursive comme asdict)"""
+        return {name: getattr(self, name) for name in _USER_SETTINGS_FIELDS}
 
-        # Mode d'enregistrement
-        recording_mode = str(data.get("recording_mode", RecordingMode.PUSH_TO_TALK))[:20]
-        try:
-            recording_mode = RecordingMode(recording_mode)
-        except ValueError:
-            recording_mode = RecordingMode.PUSH_TO_TALK
+    def to_json(self) -> bytes:
+        """Sérialise en JSON indenté (UTF-8) en un seul buffer"""
+        if _HAS_ORJSON:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        # Sans orjson: gabarit à forme fixe plutôt que dict + encodeur json générique
+        values = tuple(_encode_scalar(getattr(self, name)) for name in _USER_SETTINGS_FIELDS)
+        return (_SETTINGS_JSON_TEMPLATE % values).encode("utf-8")
 
-        # Source mode (mic / url)
-        source_mode = str(data.get("source_mode", "mic"))[:10]
-        if source_mode not in ("mic", "url"):
-            source_mode = "mic"
 
-        # Window dimensions
-        try:
-            window_width = max(420, min(2000, int(data.get("window_width", 480))))
-        except (TypeError, ValueError):
-            window_width = 480
-        try:
-            window_height = max(720, min(2000, int(data.get("window_height", 780))))
-        except (TypeError, ValueError):
-            window_height = 780
-
-        # URL language — whitelisted
-        url_language = str(data.get("url_language", "auto"))[:10]
-        if url_language not in ("auto", "fr", "en"):
-            url_language = "auto"
-
-        # URL notes format
-        url_notes_format = str(data.get("url_notes_format", "json"))[:10]
-        if url_notes_format not in ("txt", "json"):
-            url_notes_format = "json"
-
-        return cls(
-            push_to_talk_key=ptt_key,
-            output_mode=output_mode,
-            language=language,
-            ui_language=ui_language,
-            smart_formatting_enabled=smart_enabled,
-            smart_formatting_level=smart_level,
-            window_mode=window_mode,
-            window_position_x=window_x,
-            window_position_y=window_y,
-            recording_mode=recording_mode,
-            source_mode=source_mode,
-            window_width=window_width,
-            window_height=window_height,
-            url_language=url_language,
-            url_notes_format=url_notes_format,
-        )
+# Noms des champs calculés une fois (ordre de déclaration)
+_USER_SETTINGS_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(UserSettings))
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convertit en dictionnaire"""
-        return asdict(self)
+# Même sortie que json.dumps(settings.to_dict(), indent=2, ensure_ascii=False)
+_SETTINGS_JSON_TEMPLATE = "{\n" + ",\n".join(f'  "{name}": %s' for name in _USER_SETTINGS_FIELDS) + "\n}"
 
 
 class SettingsManager:
@@ -146,17 +213,37 @@ class SettingsManager:
     Thread-safe pour les accès concurrents.
     """
 
-    __slots__ = ("_settings_file", "_settings", "_lock", "_callbacks", "_save_timer", "_save_delay")
+    __slots__ = (
+        "_settings_file",
+        "_settings",
+        "_lock",
+        "_callbacks",
+        "_save_event",
+        "_save_thread",
+        "_save_stop",
+        "_save_pending",
+        "_save_delay",
+    )
 
     # Taille max du fichier de config (protection contre fichiers malveillants)
     MAX_CONFIG_SIZE: int = 10 * 1024  # 10 KB
 
     def __init__(self, settings_file: Path | None = None) -> None:
         self._settings_file = settings_file or (app_config.BASE_DIR / "user_settings.json")
+        # Snapshot immuable en pratique: toute modification passe par set() qui le remplace,
+        # ce qui permet aux lecteurs (get, settings) de se passer du lock
         self._settings = UserSettings()
-        self._lock = threading.RLock()  # RLock pour permettre réentrance
-        self._callbacks: list[Callable[[str, Any], None]] = []
-        self._save_timer: threading.Timer | None = None
+        # Lock simple (non réentrant): réservé aux écrivains, aucune méthode ne le reprend
+        # pendant qu'elle le détient (écriture via _save_unsafe, callbacks appelés hors du lock)
+        self._lock = threading.Lock()
+        # Tuple remplacé à chaque (dés)inscription: set() l'itère sans copie ni lock
+        self._callbacks: tuple[Callable[[str, Any], None], ...] = ()
+        # Sauvegarde différée: un seul thread persistant réveillé par un Event
+        self._save_event = threading.Event()
+        self._save_thread: threading.Thread | None = None
+        # Arrêt du thread courant (un Event par thread: close() puis set() en relance un neuf)
+        self._save_stop: threading.Event | None = None
+        self._save_pending = False
         self._save_delay: float = 0.5  # 500ms debounce
 
         # Charge les paramètres existants
@@ -175,61 +262,88 @@ class SettingsManager:
                     logger.warning("Fichier de config trop volumineux (%d bytes), ignore", file_size)
                     return False
 
-                with self._settings_file.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if not isinstance(data, dict):
-                        raise ValueError("Format de configuration invalide")
-                    self._settings = UserSettings.from_dict(data)
+                data = _load_json(self._settings_file, file_size)
+                if not isinstance(data, dict):
+                    raise ValueError("Format de configuration invalide")
+                self._settings = UserSettings.from_dict(data)
 
                 logger.info("Parametres charges depuis %s", self._settings_file.name)
                 return True
 
-            except json.JSONDecodeError as e:
+            except json.JSONDecodeError as e:  # orjson.JSONDecodeError en hérite
                 logger.warning("Erreur JSON dans les parametres: %s", e)
             except Exception as e:
                 logger.warning("Erreur chargement parametres: %s", e)
         return False
 
-    def save(self) -> bool:
-        """Sauvegarde les paramètres dans le fichier"""
+    def save(self, *, durable: bool = False) -> bool:
+        """
+        Sauvegarde les paramètres dans le fichier.
+
+        Par défaut, écrase directement le fichier (préférences reconstructibles).
+        Avec durable=True: fichier temporaire + fsync + renommage atomique.
+        """
         with self._lock:
-            try:
-                # Écrit dans un fichier temporaire puis renomme (atomique)
-                temp_file = self._settings_file.with_suffix(".tmp")
-                with temp_file.open("w", encoding="utf-8") as f:
-                    json.dump(self._settings.to_dict(), f, indent=2, ensure_ascii=False)
+            return self._save_unsafe(durable)
 
-                # Renommage atomique
-                temp_file.replace(self._settings_file)
-                logger.debug("Parametres sauvegardes")
-                return True
+    def flush(self, *, durable: bool = True) -> bool:
+        """Annule la sauvegarde différée en attente et écrit immédiatement (arrêt, checkpoint)"""
+        with self._lock:
+            self._save_pending = False
+            return self._save_unsafe(durable)
 
-            except Exception as e:
-                logger.error("Erreur sauvegarde parametres: %s", e)
-                # Nettoie le fichier temporaire si présent
+    def close(self) -> bool:
+        """Arrête le thread de sauvegarde et écrit durablement les modifications en attente"""
+        with self._lock:
+            thread, stop = self._save_thread, self._save_stop
+            self._save_thread = self._save_stop = None
+        if thread is not None:
+            stop.set()
+            self._save_event.set()  # Réveille le thread s'il attend une modification
+            thread.join()
+        return self.flush()
+
+    def _save_unsafe(self, durable: bool) -> bool:
+        """Sauvegarde sans lock (appelé depuis contexte verrouillé)"""
+        temp_file = self._settings_file.with_suffix(".tmp")
+        try:
+            payload = self._settings.to_json()
+            if durable:
+                # Écrit dans un fichier temporaire puis renomme (atomique)
+                _write_bytes(temp_file, payload, fsync=True)
+                temp_file.replace(self._settings_file)
+                _fsync_dir(self._settings_file.parent)
+            else:
+                _write_bytes(self._settings_file, payload, fsync=False)
+            logger.debug("Parametres sauvegardes")
+            return True
+
+        except Exception as e:
+            logger.error("Erreur sauvegarde parametres: %s", e)
+            # Nettoie le fichier temporaire si présent
+            if durable:
                 try:
                     temp_file.unlink(missing_ok=True)
                 except OSError:
                     pass
-                return False
+            return False
 
     @property
     def settings(self) -> UserSettings:
-        """Retourne les paramètres actuels"""
-        with self._lock:
-            return self._settings
+        """Retourne les paramètres actuels (snapshot, lecture sans lock)"""
+        return self._settings
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Récupère une valeur de paramètre"""
-        with self._lock:
-            return getattr(self._settings, key, default)
+        """Récupère une valeur de paramètre (lecture sans lock)"""
+        return getattr(self._settings, key, default)
 
     def set(self, key: str, value: Any, *, save: bool = True) -> None:
         """Définit une valeur de paramètre"""
         with self._lock:
             if not hasattr(self._settings, key):
                 return
-            setattr(self._settings, key, value)
+            # Copy-on-write: publie un nouveau snapshot (affectation atomique)
+            self._settings = replace(self._settings, **{key: value})
 
         if save:
             self._schedule_save()
@@ -239,35 +353,69 @@ class SettingsManager:
             try:
                 callback(key, value)
             except Exception:
-                pass
+                logger.exception("Erreur dans un callback de parametres (%s)", key)
 
     def _schedule_save(self) -> None:
         """Planifie une sauvegarde avec debounce de 500ms"""
-        if self._save_timer is not None:
-            self._save_timer.cancel()
-        self._save_timer = threading.Timer(self._save_delay, self.save)
-        self._save_timer.daemon = True
-        self._save_timer.start()
+        if self._save_thread is None:
+            with self._lock:
+                if self._save_thread is None:
+                    self._save_stop = threading.Event()
+                    self._save_thread = threading.Thread(
+                        target=self._save_loop, args=(self._save_stop,), name="settings-save", daemon=True
+                    )
+                    self._save_thread.start()
+        self._save_pending = True
+        self._save_event.set()
+
+    def _save_loop(self, stop: threading.Event) -> None:
+        """Boucle du thread de sauvegarde: écrit après 500ms sans nouvelle modification"""
+        while not stop.is_set():
+            self._save_event.wait()
+            # Repousse tant que des modifications arrivent (coalesce les rafales de set()),
+            # attente interrompue par close()
+            while self._save_event.is_set() and not stop.is_set():
+                self._save_event.clear()
+                stop.wait(self._save_delay)
+            if stop.is_set():
+                # close() se charge de l'écriture finale
+                return
+            # flush() a pu écrire entre-temps: ne sauvegarde que si encore nécessaire
+            with self._lock:
+                if self._save_pending:
+                    self._save_pending = False
+                    self._save_unsafe(durable=False)
 
     def on_change(self, callback: Callable[[str, Any], None]) -> None:
         """Enregistre un callback appelé lors des changements"""
-        self._callbacks.append(callback)
+        with self._lock:
+            self._callbacks = (*self._callbacks, callback)
 
     def remove_callback(self, callback: Callable[[str, Any], None]) -> None:
         """Supprime un callback"""
-        try:
-            self._callbacks.remove(callback)
-        except ValueError:
-            pass
+        with self._lock:
+            callbacks = list(self._callbacks)
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                return
+            self._callbacks = tuple(callbacks)
 
 
 # Instance globale
+# Les helpers get_* lisent directement le snapshot courant (settings_manager.settings):
+# pas de lock, et les paires (x, y) / (width, height) proviennent du même snapshot
 settings_manager = SettingsManager()
 
 
+def flush_settings() -> None:
+    """Arrête la sauvegarde différée et écrit durablement les paramètres (à appeler à la fermeture)"""
+    settings_manager.close()
+
+
 def get_ptt_key() -> str:
     """Retourne la touche Push-to-Talk configurée"""
-    return settings_manager.get("push_to_talk_key", hotkey_config.PUSH_TO_TALK_KEY)
+    return settings_manager.settings.push_to_talk_key
 
 
 def set_ptt_key(key: str) -> None:
@@ -277,7 +425,7 @@ def set_ptt_key(key: str) -> None:
 
 def get_language() -> str:
     """Retourne la langue configurée pour la transcription"""
-    return settings_manager.get("language", "fr")
+    return settings_manager.settings.language
 
 
 def set_language(language: str) -> None:
@@ -287,9 +435,8 @@ def set_language(language: str) -> None:
 
 def get_smart_formatting() -> tuple[bool, str]:
     """Retourne (enabled, level) pour le smart formatting"""
-    enabled = settings_manager.get("smart_formatting_enabled", True)
-    level = settings_manager.get("smart_formatting_level", "basic")
-    return enabled, level
+    snapshot = settings_manager.settings
+    return snapshot.smart_formatting_enabled, snapshot.smart_formatting_level
 
 
 def set_smart_formatting(enabled: bool, level: str = "basic") -> None:
@@ -300,7 +447,7 @@ def set_smart_formatting(enabled: bool, level: str = "basic") -> None:
 
 def get_window_mode() -> str:
     """Retourne le mode de fenêtre ('floating' ou 'normal')"""
-    return settings_manager.get("window_mode", "floating")
+    return settings_manager.settings.window_mode
 
 
 def set_window_mode(mode: str) -> None:
@@ -314,9 +461,8 @@ def set_window_mode(mode: str) -> None:
 
 def get_window_position() -> tuple[int, int]:
     """Retourne la position de la fenêtre sauvegardée (-1, -1 si non définie)"""
-    x = settings_manager.get("window_position_x", -1)
-    y = settings_manager.get("window_position_y", -1)
-    return x, y
+    snapshot = settings_manager.settings
+    return snapshot.window_position_x, snapshot.window_position_y
 
 
 def set_window_position(x: int, y: int) -> None:
@@ -347,7 +493,7 @@ def set_history_enabled(enabled: bool) -> None:
 
 def get_recording_mode() -> str:
     """Retourne le mode d'enregistrement ('push_to_talk' ou 'toggle')"""
-    return settings_manager.get("recording_mode", RecordingMode.PUSH_TO_TALK)
+    return settings_manager.settings.recording_mode
 
 
 def set_recording_mode(mode: str) -> None:
@@ -361,7 +507,7 @@ def set_recording_mode(mode: str) -> None:
 
 def get_source_mode() -> str:
     """Retourne le mode source ('mic' ou 'url')"""
-    return settings_manager.get("source_mode", "mic")
+    return settings_manager.settings.source_mode
 
 
 def set_source_mode(mode: str) -> None:
@@ -372,10 +518,8 @@ def set_source_mode(mode: str) -> None:
 
 def get_window_size() -> tuple[int, int]:
     """Retourne (width, height) sauvegardés."""
-    return (
-        settings_manager.get("window_width", 480),
-        settings_manager.get("window_height", 580),
-    )
+    snapshot = settings_manager.settings
+    return snapshot.window_width, snapshot.window_height
 
 
 def set_window_size(width: int, height: int) -> None:
@@ -386,7 +530,7 @@ def set_window_size(width: int, height: int) -> None:
 
 def get_url_language() -> str:
     """Langue cible pour les transcriptions URL ('auto', 'fr', 'en')."""
-    return settings_manager.get("url_language", "auto")
+    return settings_manager.settings.url_language
 
 
 def set_url_language(language: str) -> None:
@@ -397,7 +541,7 @@ def set_url_language(language: str) -> None:
 
 def get_url_notes_format() -> str:
     """Format d'export des notes URL ('txt' ou 'json')."""
-    return settings_manager.get("url_notes_format", "json")
+    return settings_manager.settings.url_notes_format
 
 
 def set_url_notes_format(fmt: str) -> None:
@@ -408,7 +552,7 @@ def set_url_notes_format(fmt: str) -> None:
 
 def get_ui_language_setting() -> str:
     """Retourne la langue UI configurée ('auto', 'en', 'fr')."""
-    return settings_manager.get("ui_language", "auto")
+    return settings_manager.settings.ui_language
 
 
 def set_ui_language_setting(lang: str) -> None:
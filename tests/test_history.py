@@ -44,6 +44,16 @@ class TestTranscriptionEntry:
         # Fallback: premiers 8 caractères
         assert entry.formatted_time == "not-a-va"
 
+    def test_formatted_time_is_cached(self):
+        entry = TranscriptionEntry(
+            text="Test",
+            timestamp="2024-06-15T14:30:45",
+            duration=1.0,
+            language="fr",
+            processing_time=0.1,
+        )
+        assert entry.formatted_time is entry.formatted_time
+
     def test_formatted_time_empty_string(self):
         entry = TranscriptionEntry(
             text="Test",
@@ -68,6 +78,7 @@ class TestTranscriptionEntry:
         assert d["duration"] == 2.0
         assert d["language"] == "fr"
         assert d["processing_time"] == 0.5
+        assert set(d) == {"text", "timestamp", "duration", "language", "processing_time"}
 
     def test_from_dict_complete(self):
         data = {
@@ -202,3 +213,25 @@ class TestTranscriptionHistory:
         history.add_entry(entry)
         export = history.export_text()
         assert "[14:30:45] Bonjour" in export
+
+    def test_totals_exclude_evicted_entries(self):
+        history = TranscriptionHistory(max_size=2, persist=False)
+        history.add("A", duration=1.0, processing_time=0.5)
+        history.add("B", duration=2.0, processing_time=0.25)
+        history.add("C", duration=4.0, processing_time=0.125)
+        assert history.total_duration == 6.0
+        assert history.total_processing_time == pytest.approx(0.375)
+
+    def test_zero_max_size_keeps_nothing(self):
+        history = TranscriptionHistory(max_size=0, persist=False)
+        history.add("A", duration=1.0, processing_time=0.5)
+        assert len(history) == 0
+        assert history.total_duration == 0.0
+        assert history.total_processing_time == 0.0
+
+    def test_clear_resets_totals(self):
+        history = TranscriptionHistory(persist=False)
+        history.add("A", duration=1.5, processing_time=0.3)
+        history.clear()
+        assert history.total_duration == 0.0
+        assert history.total_processing_time == 0.0
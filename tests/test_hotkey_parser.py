@@ -114,3 +114,13 @@ class TestParseHotkey:
     def test_returns_frozenset(self):
         _, modifiers = parse_hotkey("ctrl+a")
         assert isinstance(modifiers, frozenset)
+
+    def test_unknown_modifier_ignored(self):
+        key, modifiers = parse_hotkey("hyper+ctrl+a")
+        assert key == "a"
+        assert modifiers == frozenset({"ctrl"})
+
+    def test_same_combo_shares_frozenset(self):
+        _, first = parse_hotkey("ctrl+shift+a")
+        _, second = parse_hotkey("shift_l+control+b")
+        assert first is second
@@ -1,7 +1,7 @@
 """Tests pour le module settings (UserSettings)"""
 
 from src.config import OutputMode, WindowMode
-from src.utils.settings import UserSettings
+from src.utils.settings import SettingsManager, UserSettings
 
 
 class TestUserSettingsFromDict:
@@ -81,6 +81,16 @@ class TestUserSettingsFromDict:
         assert settings.window_position_x == 100
         assert settings.window_position_y == 200
 
+    def test_string_values_are_interned(self):
+        first = UserSettings.from_dict(
+            {"language": "".join(["e", "n"]), "smart_formatting_level": "".join(["sm", "art"])}
+        )
+        second = UserSettings.from_dict(
+            {"language": "".join(["e", "n"]), "smart_formatting_level": "".join(["sm", "art"])}
+        )
+        assert first.language is second.language
+        assert first.smart_formatting_level is second.smart_formatting_level
+
     def test_unknown_keys_ignored(self):
         settings = UserSettings.from_dict({"unknown_key": "value", "another": 42})
         assert settings.push_to_talk_key == "f2"  # defaults unchanged
@@ -140,3 +150,142 @@ class TestUserSettingsToDict:
             "window_position_y",
         }
         assert set(d.keys()) == expected_keys
+
+
+class TestUserSettingsToJson:
+    """Tests pour UserSettings.to_json()"""
+
+    def test_matches_stdlib_json_without_orjson(self, monkeypatch):
+        import json
+
+        import src.utils.settings as settings_module
+
+        monkeypatch.setattr(settings_module, "_HAS_ORJSON", False)
+        settings = UserSettings(push_to_talk_key='ctrl+"é', smart_formatting_enabled=False, window_position_x=-1)
+        expected = json.dumps(settings.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+        assert settings.to_json() == expected
+
+    def test_roundtrip(self):
+        import json
+
+        original = UserSettings(language="en", window_width=900)
+        restored = UserSettings.from_dict(json.loads(original.to_json()))
+        assert restored == original
+
+
+class TestSettingsManagerPersistence:
+    """Tests pour SettingsManager.save() / load()"""
+
+    def test_save_then_load_roundtrip(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        manager.set("language", "en", save=False)
+        manager.set("window_position_x", 123, save=False)
+        assert manager.save() is True
+
+        reloaded = SettingsManager(path)
+        assert reloaded.get("language") == "en"
+        assert reloaded.get("window_position_x") == 123
+
+    def test_saved_file_is_readable_json(self, tmp_path):
+        import json
+
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        manager.set("push_to_talk_key", "ctrl+é", save=False)
+        manager.save()
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["push_to_talk_key"] == "ctrl+é"
+
+    def test_invalid_json_keeps_defaults(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        path.write_text("{not json", encoding="utf-8")
+        manager = SettingsManager(path)
+        assert manager.load() is False
+        assert manager.get("language") == "fr"
+
+    def test_durable_save_leaves_no_temp_file(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        assert manager.save(durable=True) is True
+        assert path.exists()
+        assert not path.with_suffix(".tmp").exists()
+
+    def test_flush_writes_pending_change(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        manager.set("language", "en")
+        assert manager.flush() is True
+        assert SettingsManager(path).get("language") == "en"
+        manager.close()
+
+    def test_close_stops_save_thread_and_writes_pending_change(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        manager.set("language", "en")
+        thread = manager._save_thread
+        assert thread is not None and thread.is_alive()
+
+        assert manager.close() is True
+        assert not thread.is_alive()
+        assert manager._save_thread is None
+        assert SettingsManager(path).get("language") == "en"
+
+    def test_set_after_close_restarts_save_thread(self, tmp_path):
+        manager = SettingsManager(tmp_path / "user_settings.json")
+        manager.set("language", "en")
+        manager.close()
+        manager.set("language", "fr")
+        assert manager._save_thread is not None and manager._save_thread.is_alive()
+        manager.close()
+
+    def test_debounced_save_coalesces_burst(self, tmp_path):
+        import time
+
+        path = tmp_path / "user_settings.json"
+        manager = SettingsManager(path)
+        manager._save_delay = 0.01
+        manager.set("window_position_x", 10)
+        manager.set("window_position_y", 20)
+
+        deadline = time.monotonic() + 2.0
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        reloaded = SettingsManager(path)
+        assert reloaded.get("window_position_x") == 10
+        assert reloaded.get("window_position_y") == 20
+        manager.close()
+
+    def test_set_publishes_new_snapshot(self, tmp_path):
+        manager = SettingsManager(tmp_path / "user_settings.json")
+        before = manager.settings
+        manager.set("language", "en", save=False)
+        assert before.language == "fr"
+        assert manager.settings.language == "en"
+        assert manager.settings is not before
+
+    def test_empty_file_keeps_defaults(self, tmp_path):
+        path = tmp_path / "user_settings.json"
+        path.write_bytes(b"")
+        manager = SettingsManager(path)
+        assert manager.load() is False
+        assert manager.get("language") == "fr"
+
+    def test_failing_callback_does_not_block_others(self, tmp_path):
+        manager = SettingsManager(tmp_path / "user_settings.json")
+        received = []
+
+        def failing(key, value):
+            raise RuntimeError("boom")
+
+        manager.on_change(failing)
+        manager.on_change(lambda key, value: received.append((key, value)))
+        manager.set("language", "en", save=False)
+        assert received == [("language", "en")]
+
+        manager.remove_callback(failing)
+        manager.set("language", "fr", save=False)
+        assert received[-1] == ("language", "fr")
@@ -5,6 +5,7 @@ from src.smart_formatter import (
     FormattingResult,
     RuleBasedFormatter,
     SmartFormatter,
+    _format_basic_cached,
 )
 
 
@@ -73,6 +74,10 @@ class TestRuleBasedFormatter:
         result = RuleBasedFormatter.format("combien ça coûte")
         assert result.endswith("?")
 
+    def test_detect_french_question_word_not_first(self):
+        result = RuleBasedFormatter.format("tu viens quand")
+        assert result.endswith("?")
+
     def test_spaces_before_punctuation_removed(self):
         result = RuleBasedFormatter.format("bonjour ,monde")
         assert " ," not in result
@@ -90,6 +95,10 @@ class TestRuleBasedFormatter:
         assert "«" in result
         assert "»" in result
 
+    def test_multiple_quote_pairs_and_unpaired_quote(self):
+        result = RuleBasedFormatter.format('il dit "oui" puis "non" et "peut-être')
+        assert result == 'Il dit « oui » puis « non » et "peut-être.'
+
     def test_strips_whitespace(self):
         result = RuleBasedFormatter.format("  bonjour  ")
         assert not result.startswith(" ")
@@ -142,6 +151,13 @@ class TestSmartFormatterBasic:
         _, corrections = self.formatter._format_basic("bonjour")
         assert corrections >= 2
 
+    def test_cache_shared_between_instances(self):
+        _format_basic_cached.cache_clear()
+        first = self.formatter._format_basic("bonjour   monde")
+        second = SmartFormatter(level=FormattingLevel.BASIC)._format_basic("bonjour   monde")
+        assert second == first == ("Bonjour monde.", 3)
+        assert _format_basic_cached.cache_info().hits == 1
+
 
 class TestSmartFormatterFormat:
     """Tests pour SmartFormatter.format()"""
@@ -163,6 +179,13 @@ class TestSmartFormatterFormat:
         formatter = SmartFormatter(level=FormattingLevel.BASIC)
         result = formatter.format("   ")
         assert result.corrections_made == 0
+        assert result.formatted_text == "   "
+        assert result.level_used == FormattingLevel.NONE
+
+    def test_none_level_strips_input(self):
+        formatter = SmartFormatter(level=FormattingLevel.NONE)
+        result = formatter.format("  bonjour  ")
+        assert result.formatted_text == "bonjour"
 
     def test_basic_level(self):
         formatter = SmartFormatter(level=FormattingLevel.BASIC)
@@ -177,6 +200,16 @@ class TestSmartFormatterFormat:
         result = formatter.format("bonjour")
         assert result.level_used == FormattingLevel.BASIC
 
+    def test_full_level_fallback_to_basic(self):
+        formatter = SmartFormatter(level=FormattingLevel.FULL)
+        result = formatter.format("bonjour")
+        assert result.level_used == FormattingLevel.BASIC
+        assert result.formatted_text == "Bonjour."
+
+    def test_result_has_no_instance_dict(self):
+        result = SmartFormatter(level=FormattingLevel.BASIC).format("bonjour")
+        assert not hasattr(result, "__dict__")
+
     def test_preserves_original_text(self):
         formatter = SmartFormatter(level=FormattingLevel.BASIC)
         result = formatter.format("bonjour")
@@ -2,10 +2,15 @@
 
 import re
 
+import src.transcription_service as transcription_service
 from src.transcription_service import (
     _HALLUCINATION_PATTERN,
     _WHITESPACE_PATTERN,
     TranscriptionService,
+    _clean_hallucinations,
+    _clean_hallucinations_cached,
+    _may_contain_hallucination,
+    _remove_hallucinations,
 )
 
 
@@ -70,6 +75,10 @@ class TestCleanHallucinations:
         result = self.service._clean_hallucinations(text)
         assert result.strip() == ""
 
+    def test_hallucination_between_words_leaves_single_space(self):
+        result = self.service._clean_hallucinations("Bonjour [Musique] suite")
+        assert result == "Bonjour suite"
+
     def test_normalizes_whitespace(self):
         result = self.service._clean_hallucinations("Bonjour   tout    le    monde")
         assert "  " not in result
@@ -83,12 +92,54 @@ class TestCleanHallucinations:
         result = self.service._clean_hallucinations("Merci d'avoir regardé")
         assert result == ""
 
+    def test_preserves_other_bracketed_text(self):
+        # Seuls [Musique], [Applaudissements] et (Musique) sont des hallucinations connues
+        result = self.service._clean_hallucinations("[Rires] Bonjour (Public)")
+        assert result == "[Rires] Bonjour (Public)"
+
+    def test_case_expanding_characters_keep_spans_aligned(self):
+        # "İ".lower() fait 2 caractères: les positions ne doivent pas dériver
+        result = self.service._clean_hallucinations("İstanbul [Musique] fin")
+        assert result == "İstanbul fin"
+
+    def test_method_uses_cached_module_function(self):
+        _clean_hallucinations_cached.cache_clear()
+        assert self.service._clean_hallucinations("[Musique] Bonjour") == "Bonjour"
+        assert TranscriptionService._clean_hallucinations("[Musique] Bonjour") == "Bonjour"
+        assert _clean_hallucinations_cached.cache_info().hits == 1
+
+    def test_long_text_bypasses_cache(self):
+        _clean_hallucinations_cached.cache_clear()
+        text = "Bonjour [Musique] " + "mot " * (transcription_service._CLEAN_CACHE_MAX_LENGTH // 4)
+        assert self.service._clean_hallucinations(text).startswith("Bonjour mot mot")
+        assert _clean_hallucinations_cached.cache_info().currsize == 0
+
     def test_preserves_normal_merci(self):
         # "Merci de votre aide" ne doit pas être supprimé (pas dans les patterns)
         result = self.service._clean_hallucinations("Merci de votre aide")
         assert "Merci de votre aide" in result
 
 
+class TestCleanBatch:
+    """Tests pour TranscriptionService.clean_batch()"""
+
+    def test_matches_single_text_cleanup(self):
+        texts = ["Bonjour  tout le monde", "[Musique] Merci d'avoir regardé", "test... suite", "", "  Oui  "]
+        assert TranscriptionService.clean_batch(texts) == [_clean_hallucinations(text) for text in texts]
+
+    def test_empty_batch(self):
+        assert TranscriptionService.clean_batch([]) == []
+
+    def test_separator_in_input_falls_back_to_single_cleanup(self):
+        texts = ["a\x00b [Musique]", "(Musique) c"]
+        assert TranscriptionService.clean_batch(texts) == ["a\x00b", "c"]
+
+    def test_input_list_not_modified(self):
+        texts = ["[Musique] Bonjour"]
+        TranscriptionService.clean_batch(texts)
+        assert texts == ["[Musique] Bonjour"]
+
+
 class TestHallucinationPattern:
     """Tests pour le pattern regex compilé"""
 
@@ -109,3 +160,71 @@ class TestHallucinationPattern:
 
     def test_whitespace_pattern_matches_newlines(self):
         assert _WHITESPACE_PATTERN.sub(" ", "a\nb") == "a b"
+
+
+class TestHallucinationPrefilter:
+    """Tests pour le pré-filtre _may_contain_hallucination()"""
+
+    def test_every_hallucination_passes_prefilter(self):
+        samples = (
+            "Merci d'avoir regardé",
+            "Sous-titres réalisés",
+            "Sous-titres par",
+            "MERCI À TOUS",
+            "À bientôt",
+            "Abonnez-vous",
+            "N'oubliez pas de",
+            "Cliquez sur",
+            "[Musique]",
+            "[Applaudissements]",
+            "(Musique)",
+            "....",
+        )
+        for sample in samples:
+            assert _HALLUCINATION_PATTERN.search(sample)
+            assert _may_contain_hallucination(sample), sample
+
+    def test_dotted_and_dotless_i_pass_prefilter(self):
+        # re.IGNORECASE assimile "ı" et "İ" à "i", contrairement à casefold()
+        for sample in ("Bonjour Clıquez sur ici", "Bonjour ClİQUEZ SUR ici"):
+            assert _HALLUCINATION_PATTERN.search(sample)
+            assert _may_contain_hallucination(sample), sample
+
+    def test_clean_text_is_filtered_out(self):
+        assert not _may_contain_hallucination("Merci de votre aide.. à demain")
+
+
+class TestRemoveHallucinationsBackends:
+    """Le backend Hyperscan (si installé) et le fallback re doivent être équivalents"""
+
+    SAMPLES = (
+        "Bonjour tout le monde",
+        "[Musique] Bonjour... Merci d'avoir regardé",
+        "MERCI D'AVOIR REGARDÉ et à bientôt.....",
+        "Sous-titres réalisés par la communauté (Musique)",
+        "test.. suite",
+        "Mercı à tous",
+        "MERCİ À TOUS",
+    )
+
+    def test_regex_fallback_matches_ignorecase_pattern(self, monkeypatch):
+        monkeypatch.setattr(transcription_service, "_HYPERSCAN_DATABASE", None)
+        # Inclut des textes dont casefold() change la longueur ou diffère d'IGNORECASE
+        samples = (*self.SAMPLES, "Straße (MUSIQUE) fin", "İci [Musique]", "Mercı à tous... bye")
+        for text in samples:
+            assert _remove_hallucinations(text) == _HALLUCINATION_PATTERN.sub("", text), text
+
+    def test_default_backend_matches_ignorecase_pattern(self):
+        assert [_remove_hallucinations(text) for text in self.SAMPLES] == [
+            _HALLUCINATION_PATTERN.sub("", text) for text in self.SAMPLES
+        ]
+
+    def test_dotted_and_dotless_i_are_cleaned(self):
+        service = TranscriptionService.__new__(TranscriptionService)
+        assert service._clean_hallucinations("Bonjour Clıquez sur ici") == "Bonjour ici"
+        assert service._clean_hallucinations("Bonjour ClİQUEZ SUR ici") == "Bonjour ici"
+
+    def test_regex_fallback_matches_default_backend(self, monkeypatch):
+        expected = [_remove_hallucinations(text) for text in self.SAMPLES]
+        monkeypatch.setattr(transcription_service, "_HYPERSCAN_DATABASE", None)
+        assert [_remove_hallucinations(text) for text in self.SAMPLES] == expected